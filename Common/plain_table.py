@@ -0,0 +1,193 @@
+import math
+import re
+from itertools import chain
+
+try:
+    from wcwidth import wcswidth     # 한글 등 전각 문자 폭 2 (tabulate 와 동일)
+except ImportError:
+    wcswidth = None
+
+'''
+tabulate 0.10 의 tabulate(tablefmt="plain", stralign="left", numalign="left") 와 동일한 결과를 내는 경량 표 출력
+- 열 너비를 미리 계산한 뒤 한 번에 out.write() 로 출력 (pandas/tabulate 불필요)
+- 열 구분 공백 2칸, 열 최소 너비는 헤더 폭 + 2, 각 줄 끝 공백 제거
+- 셀 앞뒤 공백 제거, 줄바꿈(\\r, \\n) 포함 표는 tabulate 와 같은 방식으로 여러 줄 출력
+- ANSI 색상 코드/링크는 폭 계산에서 제외
+- 모든 값이 숫자이고 실수가 섞인 열은 tabulate 처럼 '%g' 형식으로 변환 (빈 셀은 열 종류 판정에서 제외)
+'''
+
+SEPARATOR = "  "
+MIN_PADDING = 2
+
+# 열 종류 - 더 일반적인 종류가 큰 값 (tabulate 의 bool < int < float < str 순서)
+_BOOL, _INT, _FLOAT, _STR = range(4)
+
+# 천 단위 구분 기호가 있는 숫자 (예: 1,000 / -1,000.5)
+_THOUSANDS_NUMBER = re.compile(r"^(([+-]?[0-9]{1,3})(?:,([0-9]{3}))*)?(?(1)\.[0-9]*|\.[0-9]+)?$")
+
+# 여러 줄 판정 / 폭 계산용 줄 구분 - tabulate 와 동일하게 \r, \n 만 사용
+_LINE_BREAK = re.compile(r"[\r\n]")
+
+# ANSI 색상 코드(CSI) 및 터미널 링크(OSC 8) - tabulate 와 동일한 패턴, 링크는 링크 텍스트만 남김
+_ANSI_CODES = re.compile(r"""
+    (
+        \x1b\[
+        [\x30-\x3f]*
+        [\x20-\x2f]*
+        [\x40-\x7e]
+    |
+        \x1b\]8;
+        (\w+=\w+:?)*
+        ;
+        ([^\x1b]+)
+        \x1b\\
+        ([^\x1b]+)
+        \x1b\]8;;\x1b\\
+    )
+""", re.VERBOSE)
+
+
+# 출력 폭 - 출력 가능한 ASCII 문자열은 글자 수와 같으므로 wcswidth 생략
+def _text_width(text):
+    if wcswidth is None or (text.isascii() and text.isprintable()):
+        return len(text)
+    return wcswidth(text)
+
+
+def _strip_ansi(text):
+    return _ANSI_CODES.sub(r"\4", text)
+
+
+# ANSI 코드를 제외한 출력 폭
+def _visible_width(text):
+    return _text_width(_strip_ansi(text))
+
+
+# 셀 값 종류 판정 (빈 셀은 호출하지 않음)
+def _cell_kind(value):
+    if value in ("True", "False"):
+        return _BOOL
+    try:
+        int(value)
+        return _INT
+    except ValueError:
+        pass
+    if _THOUSANDS_NUMBER.match(value):
+        return _FLOAT if "." in value else _INT
+    try:
+        number = float(value)
+    except ValueError:
+        return _STR
+    if (math.isinf(number) or math.isnan(number)) and value.lower() not in ("inf", "-inf", "nan"):
+        return _STR
+    return _FLOAT
+
+
+# 실수 열 값 변환 - 변환할 수 없는 값(True 등)은 그대로 둠
+def _format_float(value, has_invisible):
+    try:
+        if has_invisible:
+            # 색상 코드가 있는 표는 코드 안쪽 숫자만 변환 (천 단위 구분 기호 미처리 - tabulate 와 동일)
+            raw = _strip_ansi(value)
+            return value.replace(raw, format(float(raw), "g"))
+        return format(float(value.replace(",", "")), "g")
+    except ValueError:
+        return value
+
+
+# 한 줄짜리 표의 열 정렬 - (정렬된 셀 목록, 열 너비)
+def _align_column(cells, header, line_width):
+    cell_widths = [line_width(c) for c in cells]
+    width = max(cell_widths, default=0)
+    width = max(width, line_width(header) + MIN_PADDING)
+    return [c + " " * (width - w) for c, w in zip(cells, cell_widths)], width
+
+
+# 여러 줄 표의 열 정렬 - (정렬된 셀 목록, 열 너비)
+# tabulate 와 동일하게 폭은 \r, \n 기준 조각으로 계산하고 채우기는 splitlines() 줄 단위로 함
+def _align_multiline_column(cells, header, line_width, fixed_width):
+    def multiline_width(text):
+        return max(line_width(p) for p in _LINE_BREAK.split(text))
+
+    min_width = multiline_width(header) + MIN_PADDING
+    pieces = [_LINE_BREAK.split(c) for c in cells]
+    piece_widths = [[line_width(p) for p in cell_pieces] for cell_pieces in pieces]
+    width = max((w for widths in piece_widths for w in widths), default=0)
+    width = max(width, min_width)
+
+    if fixed_width:
+        padded = ["\n".join(line.ljust(width) for line in c.splitlines()) for c in cells]
+    else:
+        padded = [
+            "\n".join(
+                line.ljust(width - (w - len(p)))
+                for line, p, w in zip(c.splitlines(), cell_pieces, widths)
+            )
+            for c, cell_pieces, widths in zip(cells, pieces, piece_widths)
+        ]
+    return padded, max(min_width, max((multiline_width(c) for c in padded), default=0))
+
+
+# 헤더와 행(문자열 튜플) 목록을 plain 형식 표로 out 에 출력
+def write_plain_table(out, headers, rows):
+    columns = range(len(headers))
+    plain_text = "\t".join(chain(headers, chain.from_iterable(rows)))
+    has_invisible = _ANSI_CODES.search(plain_text) is not None
+    multiline = _LINE_BREAK.search(plain_text) is not None
+    line_width = _visible_width if has_invisible else _text_width
+
+    # 열 종류 판정
+    kinds = [_BOOL] * len(headers)
+    for row in rows:
+        for i in columns:
+            if kinds[i] != _STR:
+                value = _strip_ansi(row[i]) if "\x1b" in row[i] else row[i]
+                if value:
+                    kinds[i] = max(kinds[i], _cell_kind(value))
+
+    # 열 너비 계산 및 정렬
+    padded_columns = []
+    widths = []
+    for i in columns:
+        if kinds[i] == _FLOAT:
+            cells = [_format_float(row[i], has_invisible).strip() if row[i] else "" for row in rows]
+        else:
+            cells = [row[i].strip() for row in rows]
+        if multiline:
+            padded, width = _align_multiline_column(
+                cells, headers[i], line_width, wcswidth is None and not has_invisible
+            )
+        else:
+            padded, width = _align_column(cells, headers[i], line_width)
+        padded_columns.append(padded)
+        widths.append(width)
+
+    # 출력
+    if not multiline:
+        out.write(SEPARATOR.join(h + " " * (w - line_width(h)) for h, w in zip(headers, widths)).rstrip())
+        for cells in zip(*padded_columns):
+            out.write("\n")
+            out.write(SEPARATOR.join(cells).rstrip())
+        return
+
+    header_cells = [
+        "\n".join(p + " " * (w - line_width(p)) for p in _LINE_BREAK.split(h))
+        for h, w in zip(headers, widths)
+    ]
+    out.write("\n".join(_multiline_row_lines(header_cells, widths)))
+    for cells in zip(*padded_columns):
+        for line in _multiline_row_lines(cells, widths):
+            out.write("\n")
+            out.write(line)
+
+
+# 여러 줄 행의 출력 줄 목록 - 줄 수가 모자란 셀은 열 너비만큼 공백으로 채움
+def _multiline_row_lines(cells, widths):
+    cells_lines = [c.splitlines() for c in cells]
+    height = max(len(lines) for lines in cells_lines)
+    return [
+        SEPARATOR.join(
+            lines[n] if n < len(lines) else " " * w for lines, w in zip(cells_lines, widths)
+        ).rstrip()
+        for n in range(height)
+    ]
@@ -1,6 +1,6 @@
 import time
 import traceback
-import pandas as pd
+from typing import NamedTuple
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
@@ -16,6 +16,17 @@ from selenium.common.exceptions import (
 from knw_Chromedriver_manager import Chromedriver_manager
 
 
+# 스팸 문서 목록 헤더 (검색어, 판정사유, Url)
+SPAM_DOC_HEADERS = ('검색어', '판정사유', 'Url')
+
+
+# 스팸 문서 1건 - 리포트 표의 한 행
+class SpamDoc(NamedTuple):
+    keyword: str
+    reason: str
+    url: str
+
+
 class DSATUtil:
     """
     DSAT 웹사이트 크롤링 및 스팸 문서 수집을 위한 클래스
@@ -244,28 +255,26 @@ class DSATUtil:
             # 테이블 데이터 추출
             table = spam_list_section.find_element(By.CSS_SELECTOR, "div.ant-table-wrapper")
             headers = [h.text.strip() for h in table.find_elements(By.CSS_SELECTOR, "thead th") if h.text.strip()]
-            desired_headers = ['검색어', '판정사유', 'Url']
             if 'Url' not in headers:
                 headers.append('Url')
 
             rows = table.find_elements(By.CSS_SELECTOR, "tbody tr.ant-table-row")
-            final_data = []
+            spam_docs = []
             for row in rows:
                 cells = row.find_elements(By.TAG_NAME, 'td')
-                row_data = {}
+                values = [''] * len(SPAM_DOC_HEADERS)
                 for i, cell in enumerate(cells):
                     header = headers[i]
-                    if header in desired_headers:
+                    if header in SPAM_DOC_HEADERS:
                         if header == 'Url':
-                            row_data[header] = cell.find_element(By.TAG_NAME, 'a').get_attribute('href')
+                            value = cell.find_element(By.TAG_NAME, 'a').get_attribute('href') or ''
                         else:
-                            row_data[header] = cell.text
-                final_data.append(row_data)
+                            value = cell.text
+                        values[SPAM_DOC_HEADERS.index(header)] = value
+                spam_docs.append(SpamDoc(*values))
 
-            import pandas as pd
-            df = pd.DataFrame(final_data, columns=desired_headers)
-            self.log.log(f"✅ {len(df)}개의 스팸 문서를 성공적으로 수집했습니다.")
-            return df
+            self.log.log(f"✅ {len(spam_docs)}개의 스팸 문서를 성공적으로 수집했습니다.")
+            return spam_docs
 
         except Exception as e:
             self.log.log(f"❌ 스팸 문서 수집 중 오류: {str(e)}", level='ERROR')
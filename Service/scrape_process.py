@@ -0,0 +1,208 @@
+import io
+import os
+import queue
+import signal
+import subprocess
+import time
+import traceback
+import multiprocessing
+from Common.log import Log
+from Common.plain_table import write_plain_table
+from Service.dsat_util import DSATUtil, SPAM_DOC_HEADERS
+
+'''
+스팸률 수집 작업 실행 영역
+- collect_spam_report : 로그인부터 아지트 글 작성까지 수집 1회분 (스레드/프로세스 모드 공용)
+- ScrapeProcess : 수집 작업을 별도 프로세스로 실행하고 진행 로그/결과를 큐로 전달받음
+  제한 시간 초과 또는 중단 요청 시 작업 프로세스와 크롬/chromedriver 까지 강제 종료
+'''
+
+# 큐 메시지 종류
+MSG_PROGRESS = "progress"
+MSG_FINISHED = "finished"
+MSG_ERROR = "error"
+MSG_ABORTED = "aborted"      # 제한 시간 초과 / 중단 요청으로 강제 종료 (다음 주기에 재시도)
+
+
+# 스팸률 수집 1회 실행 - 결과 dict 반환, 실패 시 예외 발생
+def collect_spam_report(log, username, password, headless):
+    dsat = DSATUtil(log=log, headless=headless)
+    try:
+        # 로그인
+        if not dsat.login(username, password):
+            raise ConnectionError("비밀번호 오류 또는 로그인 실패")
+
+        # 홈 정보 수집
+        progress_text_value = dsat.get_progress_info()
+        dsat.get_query_count_info()
+        dsat.get_result_info()
+
+        # 리포트 클릭
+        link_txt, link_href = dsat.click_report()
+        if link_txt is None or link_href is None:
+            raise ValueError("'대기중' 상태인 평가 리포트 클릭 실패")
+
+        # 스팸률 및 문서 수집
+        spam_percentage = dsat.get_spam_percentage()
+        spam_docs = dsat.get_spam_doc()
+
+        # 아지트 글 작성 영역
+        agit_txt = ""
+        spam_doc_count = 0
+        if spam_docs:
+            spam_doc_count = len(spam_docs)
+            log.log(f"✅ 스팸 문서 {spam_doc_count}건 수집 완료.")
+
+            out = io.StringIO()
+            out.write(
+                f'<인덱스평가 *{link_txt}* 스팸 발생 현황 알림>\n'
+                f'# 스팸률은 현재 {spam_percentage}입니다.\n'
+                f'# 평가 진행률은 현재 {progress_text_value}입니다.\n\n'
+                '────────────────────────────────\n'
+                '*[스팸 문서 목록]*\n'
+            )
+            write_plain_table(out, SPAM_DOC_HEADERS, spam_docs)
+            out.write(
+                '\n'
+                '────────────────────────────────\n'
+                f'[리포트 페이지 : {link_href}]\n\n\n'
+                '@namoo.kim\n'
+                '@@index\n'
+            )
+            agit_txt = out.getvalue()
+        else:
+            log.log("수집된 스팸 문서가 없습니다.")
+
+        return {
+            'link_txt': link_txt,
+            'spam_percentage': spam_percentage,
+            'progress_text_value': progress_text_value,
+            'spam_doc_count': spam_doc_count,
+            'agit_txt': agit_txt
+        }
+    finally:
+        dsat.close()
+
+
+# 프로세스 트리 강제 종료 (작업 프로세스, chromedriver, 크롬)
+def kill_process_tree(pid):
+    if not pid:
+        return
+    if os.name == 'nt':
+        # /T : 자식 프로세스(chromedriver → 크롬)까지 함께 종료
+        subprocess.run(
+            ['taskkill', '/F', '/T', '/PID', str(pid)],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+        )
+    else:
+        # 작업 프로세스는 setsid 로 자체 프로세스 그룹을 가지므로 그룹 단위로 종료 (chromedriver, 크롬 포함)
+        try:
+            os.killpg(pid, signal.SIGKILL)
+        except OSError:
+            pass
+
+
+# 작업 프로세스 진입점 - 진행 로그와 결과를 큐로 전송
+def _scrape_process_main(msg_queue, username, password, headless):
+    if os.name != 'nt':
+        os.setsid()
+
+    log = Log(gui_logger=lambda msg: msg_queue.put((MSG_PROGRESS, msg)))
+    try:
+        log.log("★ 스팸률 수집 작업을 시작합니다. (별도 프로세스) ★")
+        result_data = collect_spam_report(log, username, password, headless)
+        msg_queue.put((MSG_FINISHED, result_data))
+    except Exception as e:
+        log.log(f"작업 중 오류 발생: {str(e)}", level='ERROR')
+        log.log(traceback.format_exc(), level='ERROR')
+        msg_queue.put((MSG_ERROR, str(e)))
+    finally:
+        log.log("★ 크롬 브라우저 종료 완료 ★")
+        log.gui_logger = None
+
+
+class ScrapeProcess:
+    """
+    스팸률 수집 작업을 별도 프로세스로 실행하는 클래스.
+    - messages() 로 진행 로그 / 결과 / 오류를 (종류, 내용) 형태로 순서대로 받음.
+    - deadline_sec 초과 시 또는 kill() 호출 시 크롬 브라우저까지 강제 종료.
+    """
+
+    POLL_INTERVAL_SEC = 0.2     # 큐 확인 주기
+    EXIT_GRACE_SEC = 30         # 결과 수신 후 브라우저 종료 대기 시간
+
+    def __init__(self, username, password, headless, deadline_sec):
+        self.username = username
+        self.password = password
+        self.headless = headless
+        self.deadline_sec = deadline_sec
+        self.process = None
+        self._killed = False
+        # PyInstaller exe / Windows 와 동일하게 spawn 방식 사용 (Qt 상태를 물려받지 않음)
+        self._ctx = multiprocessing.get_context('spawn')
+        self._queue = self._ctx.Queue()
+
+    # 작업 프로세스 시작
+    def start(self):
+        self.process = self._ctx.Process(
+            target=_scrape_process_main,
+            args=(self._queue, self.username, self.password, self.headless),
+            daemon=True
+        )
+        self.process.start()
+
+    # 작업 강제 종료 (다른 스레드에서 호출 가능)
+    def kill(self):
+        self._killed = True
+        self._reap()
+
+    # 작업 프로세스 트리(chromedriver, 크롬 포함) 정리 - 작업 프로세스가 살아 있을 때만 (종료된 PID 재사용 방지)
+    def _reap(self):
+        if self.process is None or not self.process.is_alive():
+            return
+        kill_process_tree(self.process.pid)
+
+    # 큐 메시지 순차 반환 - 마지막은 항상 MSG_FINISHED, MSG_ERROR 또는 MSG_ABORTED
+    def messages(self):
+        deadline = time.monotonic() + self.deadline_sec
+        result = None
+
+        while True:
+            # 진행 로그가 계속 들어와도 중단 요청/제한 시간은 매번 확인
+            now = time.monotonic()
+            if self._killed:
+                result = result or (MSG_ABORTED, "작업이 중단되었습니다.")
+                break
+            if now > deadline:
+                if result is None:
+                    result = (MSG_ABORTED, f"작업 제한 시간({self.deadline_sec}초) 초과로 강제 종료되었습니다.")
+                self._reap()
+                break
+
+            try:
+                kind, payload = self._queue.get(timeout=max(0, min(self.POLL_INTERVAL_SEC, deadline - now)))
+            except queue.Empty:
+                # 종료 직후 큐에 남은 메시지가 있을 수 있으므로 큐가 빈 경우에만 종료
+                if not self.process.is_alive() and self._queue.empty():
+                    break
+                continue
+
+            if kind == MSG_PROGRESS:
+                yield kind, payload
+            else:
+                # 결과 수신 후 브라우저 종료 로그까지 받도록 프로세스 종료를 기다림
+                result = (kind, payload)
+                deadline = min(deadline, time.monotonic() + self.EXIT_GRACE_SEC)
+
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self._reap()
+            self.process.join(timeout=5)
+        self._queue.close()
+
+        if result is None and self._killed:
+            result = (MSG_ABORTED, "작업이 중단되었습니다.")
+        elif result is None:
+            result = (MSG_ERROR, f"작업 프로세스가 비정상 종료되었습니다. (exitcode={self.process.exitcode})")
+        yield result
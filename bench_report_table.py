@@ -0,0 +1,92 @@
+import io
+import random
+import subprocess
+import sys
+import timeit
+from Common.plain_table import write_plain_table
+
+'''
+스팸 문서 표 출력 성능 비교 (개발용, 배포 exe 미포함)
+- 기존 : dict 목록 → pd.DataFrame → .values.tolist() → tabulate(tablefmt="plain")
+- 변경 : SpamDoc 튜플 목록 → write_plain_table()
+- 100 / 1,000 / 10,000 행에서 출력 결과가 같은지 확인 후 시간 비교
+실행 : python bench_report_table.py  (pandas, tabulate 0.10 설치 필요)
+'''
+
+HEADERS = ('검색어', '판정사유', 'Url')
+ROW_COUNTS = (100, 1000, 10000)
+REPEAT = 5
+
+# 출력 일치 확인용 경계 사례 - 빈 셀, 숫자 열, 공백, 여러 줄 셀, \r/\n 외 줄 구분 문자, ANSI 색상 코드
+EDGE_CASES = [
+    [('1.50', 'a', 'u'), ('', 'b', 'v')],
+    [('1', '', 'u'), ('', '', ''), ('3', 'c', 'w')],
+    [('2.0', '1e3', ''), ('0.25', 'nan', 'x')],
+    [(' 공백 ', '판정\n사유', 'u'), ('', '', 'https://example.com/a')],
+    [('a\x0bb', '\u2028x', 'u'), ('c', '판정\r\n사유', 'v')],
+    [('\x1b[31m스팸\x1b[0m', '\x1b[1m1.5\x1b[0m', 'u'), ('b', '2', 'v')],
+]
+
+
+# 테스트용 스팸 문서 목록 생성 (튜플)
+def make_rows(count, seed=0):
+    rnd = random.Random(seed)
+    words = ['스팸', '광고', 'casino', '대출', 'free', '무료 쿠폰', 'bitcoin', '성인', '도박 사이트', 'loan', '']
+    reasons = ['광고성 문서', '성인 문서', '도박', '피싱 의심', 'Spam keyword', '중복 문서 (복사)']
+    return [
+        (
+            ' '.join(rnd.choice(words) for _ in range(rnd.randint(1, 3))),
+            rnd.choice(reasons),
+            f'https://example.com/doc/{rnd.randint(1, 10 ** rnd.randint(1, 9))}?q={i}'
+        )
+        for i in range(count)
+    ]
+
+
+# 기존 방식
+def render_tabulate(rows):
+    import pandas as pd
+    from tabulate import tabulate
+    df = pd.DataFrame([dict(zip(HEADERS, row)) for row in rows], columns=list(HEADERS))
+    return tabulate(
+        df.values.tolist(),
+        headers=df.columns.tolist(),
+        tablefmt="plain", stralign="left", numalign="left"
+    )
+
+
+# 변경 방식
+def render_plain(rows):
+    out = io.StringIO()
+    write_plain_table(out, HEADERS, rows)
+    return out.getvalue()
+
+
+# 모듈 import 시간 (별도 인터프리터에서 측정)
+def import_time(statement):
+    code = f"import time; t = time.perf_counter(); {statement}; print(time.perf_counter() - t)"
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return float(result.stdout)
+
+
+def main():
+    print(f"import pandas, tabulate      : {import_time('import pandas, tabulate') * 1000:8.1f} ms")
+    print(f"import Common.plain_table    : {import_time('import Common.plain_table') * 1000:8.1f} ms")
+    print()
+    for rows in EDGE_CASES:
+        if render_tabulate(rows) != render_plain(rows):
+            raise AssertionError(f"출력 결과가 tabulate 와 다릅니다: {rows!r}")
+
+    print(f"{'행 수':>8}  {'pandas+tabulate':>16}  {'plain_table':>12}  {'배율':>6}")
+    for count in ROW_COUNTS:
+        rows = make_rows(count)
+        if render_tabulate(rows) != render_plain(rows):
+            raise AssertionError(f"{count}행 출력 결과가 tabulate 와 다릅니다.")
+
+        old = min(timeit.repeat(lambda: render_tabulate(rows), number=1, repeat=REPEAT))
+        new = min(timeit.repeat(lambda: render_plain(rows), number=1, repeat=REPEAT))
+        print(f"{count:>8,}  {old * 1000:>13.2f} ms  {new * 1000:>9.2f} ms  {old / new:>5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
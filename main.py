@@ -1,17 +1,22 @@
 import sys
 import os
 import traceback
+import multiprocessing
 from datetime import datetime
 from PyQt5.QtWidgets import QApplication, QWidget, QMessageBox, QLineEdit
 from PyQt5.QtCore import QThread, pyqtSignal, QTimer
 from PyQt5.uic import loadUi
 from PyQt5.QtGui import QIcon
 from Common.log import Log
-from Service.dsat_util import DSATUtil
 from Service import agit_webhook
-from tabulate import tabulate
+from Service.scrape_process import ScrapeProcess, collect_spam_report, MSG_PROGRESS, MSG_FINISHED, MSG_ABORTED
 import knw_license
 
+# 수집 작업 실행 방식 - True : 별도 프로세스 (멈춘 작업 강제 종료 가능), False : GUI 프로세스 내 스레드
+USE_SCRAPE_PROCESS = True
+# 별도 프로세스 모드의 수집 1회 제한 시간 (초과 시 크롬 브라우저까지 강제 종료)
+SCRAPE_DEADLINE_SEC = 300
+
 
 # PyInstaller 실행 파일(.exe)을 위한 리소스 경로 변환 함수
 def resource_path(relative_path):
@@ -26,6 +31,7 @@ class ScrapingWorker(QThread):
     progress = pyqtSignal(str)
     finished = pyqtSignal(dict)
     error = pyqtSignal(str)
+    aborted = pyqtSignal(str)       # 스레드 모드에서는 사용하지 않음 (프로세스 모드와 동일한 인터페이스)
 
     def __init__(self, username, password, headless_mode):
         super().__init__()
@@ -37,60 +43,7 @@ class ScrapingWorker(QThread):
         log = Log(gui_logger=self.progress.emit)
         try:
             log.log("★ 스팸률 수집 작업을 시작합니다. ★")
-            dsat = DSATUtil(log=log, headless=self.headless_mode)
-
-            # 로그인
-            if not dsat.login(self.username, self.password):
-                raise ConnectionError("비밀번호 오류 또는 로그인 실패")
-
-            # 홈 정보 수집
-            progress_text_value = dsat.get_progress_info()
-            dsat.get_query_count_info()
-            dsat.get_result_info()
-
-            # 리포트 클릭
-            link_txt, link_href = dsat.click_report()
-            if link_txt is None or link_href is None:
-                raise ValueError("'대기중' 상태인 평가 리포트 클릭 실패")
-
-            # 스팸률 및 문서 수집
-            spam_percentage = dsat.get_spam_percentage()
-            spam_documents_df = dsat.get_spam_doc()
-
-            # 아지트 글 작성 영역
-            agit_txt = ""
-            spam_doc_count = 0
-            if spam_documents_df is not None and not spam_documents_df.empty:
-                spam_doc_count = len(spam_documents_df)
-                log.log(f"✅ 스팸 문서 {spam_doc_count}건 수집 완료.")
-
-                spam_text = tabulate(
-                    spam_documents_df.values.tolist(),
-                    headers=spam_documents_df.columns.tolist(),
-                    tablefmt="plain", stralign="left", numalign="left"
-                )
-                agit_txt = (
-                    f'<인덱스평가 *{link_txt}* 스팸 발생 현황 알림>\n'
-                    f'# 스팸률은 현재 {spam_percentage}입니다.\n'
-                    f'# 평가 진행률은 현재 {progress_text_value}입니다.\n\n'
-                    '────────────────────────────────\n'
-                    '*[스팸 문서 목록]*\n'
-                    f'{spam_text}\n'
-                    '────────────────────────────────\n'
-                    f'[리포트 페이지 : {link_href}]\n\n\n'
-                    '@namoo.kim\n'
-                    '@@index\n'
-                )
-            else:
-                log.log("수집된 스팸 문서가 없습니다.")
-
-            result_data = {
-                'link_txt': link_txt,
-                'spam_percentage': spam_percentage,
-                'progress_text_value': progress_text_value,
-                'spam_doc_count': spam_doc_count,
-                'agit_txt': agit_txt
-            }
+            result_data = collect_spam_report(log, self.username, self.password, self.headless_mode)
             self.finished.emit(result_data)
 
         except Exception as e:
@@ -99,10 +52,46 @@ class ScrapingWorker(QThread):
             log.log(traceback.format_exc(), level='ERROR')
             self.error.emit(str(e))
         finally:
-            dsat.close()
             log.gui_logger = None
             log.log("★ 크롬 브라우저 종료 완료 ★")
 
+    # 스레드 모드는 강제 종료 불가 - 현재 작업이 끝날 때까지 대기
+    def kill(self):
+        pass
+
+
+
+# 백그라운드 작업 영역 (별도 프로세스 모드) - GUI 프로세스와 분리되어 멈춘 작업을 강제 종료 가능
+class ScrapingProcessWorker(QThread):
+    progress = pyqtSignal(str)
+    finished = pyqtSignal(dict)
+    error = pyqtSignal(str)
+    aborted = pyqtSignal(str)       # 제한 시간 초과 등으로 강제 종료 - 자동 새로고침은 계속 진행
+
+    def __init__(self, username, password, headless_mode, deadline_sec=SCRAPE_DEADLINE_SEC):
+        super().__init__()
+        self.scrape = ScrapeProcess(username, password, headless_mode, deadline_sec)
+
+    def run(self):
+        try:
+            self.scrape.start()
+            for kind, payload in self.scrape.messages():
+                if kind == MSG_PROGRESS:
+                    self.progress.emit(payload)
+                elif kind == MSG_FINISHED:
+                    self.finished.emit(payload)
+                elif kind == MSG_ABORTED:
+                    self.aborted.emit(payload)
+                else:
+                    self.error.emit(payload)
+        except Exception as e:
+            self.scrape.kill()
+            self.error.emit(str(e))
+
+    # 작업 프로세스 및 크롬 브라우저 강제 종료
+    def kill(self):
+        self.scrape.kill()
+
 
 
 # 아지트 공유 버튼 작동 영역
@@ -168,15 +157,32 @@ class MainWindow(QWidget):
 
     # 자동 새로고침 영역_정보 표시
     def trigger_scraping(self):
+        # 이전 작업이 진행 중이면 이번 주기는 건너뜀 (멈춘 작업은 작업 자체의 제한 시간으로 종료됨)
+        if self.worker and self.worker.isRunning():
+            self.label_status.setText("상태: 이전 수집 작업 진행 중. 이번 실행은 건너뜁니다.")
+            return
+
         self.button_share_agit.setEnabled(False)
         self.label_status.setText("상태: 정보 수집 중...")
         headless_mode = self.checkBox_headless.isChecked()
-        self.worker = ScrapingWorker(self.username, self.password, headless_mode)
+        worker_class = ScrapingProcessWorker if USE_SCRAPE_PROCESS else ScrapingWorker
+        self.worker = worker_class(self.username, self.password, headless_mode)
         self.worker.finished.connect(self.update_ui_data)
         self.worker.error.connect(self.handle_error)
+        self.worker.aborted.connect(self.handle_aborted)
         self.worker.progress.connect(self.update_status_label)
         self.worker.start()
 
+    # 수집 작업 중단 - 중단에 따른 오류 알림이 표시되지 않도록 시그널 연결 해제 후 종료
+    def stop_worker(self):
+        self.worker.finished.disconnect()
+        self.worker.error.disconnect()
+        self.worker.aborted.disconnect()
+        self.worker.progress.disconnect()
+        self.worker.kill()
+        self.worker.quit()
+        self.worker.wait()
+
     # 자동 새로고침 영역_수집된 정보 ui 표시
     def update_ui_data(self, data):
         self.label_link_txt.setText(f"차수: {data.get('link_txt', 'N/A')}")
@@ -202,6 +208,14 @@ class MainWindow(QWidget):
         if self.timer.isActive():
             self.stop_auto_refresh()
 
+    # 자동 새로고침 영역_강제 종료 알림 - 오류 창 없이 상태만 표시하고 다음 주기에 다시 수집
+    def handle_aborted(self, message):
+        Log().log(message, level='WARNING')
+        if self.timer.isActive():
+            self.label_status.setText(f"상태: {message} 다음 주기에 다시 수집합니다.")
+        else:
+            self.label_status.setText(f"상태: {message}")
+
     # ui 하단 진행 상태 표시
     def update_status_label(self, text):
         self.label_status.setText(f"상태: {text}")
@@ -239,14 +253,15 @@ class MainWindow(QWidget):
     # 작업 종료
     def closeEvent(self, event):
         if self.worker and self.worker.isRunning():
-            self.worker.quit()
-            self.worker.wait()
+            self.stop_worker()
         event.accept()
 
 
 
 # 실행
 if __name__ == "__main__":
+    # PyInstaller exe 에서 별도 프로세스 모드 사용 시 필요
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()